@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass
 from collections.abc import Sequence
+from functools import cached_property, lru_cache
 from itertools import product, islice
 from warnings import catch_warnings, warn
 from typing import Self, Iterable, Iterator, Literal, overload, Union
@@ -134,6 +135,18 @@ def pyxtal(
         return structures
 
 
+@lru_cache(maxsize=None)
+def _prototype_tol_matrix(prototype: str) -> Tol_matrix:
+    """Tolerance matrices for the fixed pyxtal prototypes; construction touches pyxtal internals."""
+    return Tol_matrix(prototype=prototype)
+
+
+@lru_cache(maxsize=None)
+def _radii_tol_matrix(radii: frozenset[tuple[str, float]]) -> Tol_matrix:
+    """Tolerance matrix equivalent to a DistanceFilter with the given radii."""
+    return DistanceFilter(dict(radii)).to_tol_matrix()
+
+
 @dataclass(eq=True, frozen=True)
 class Formulas(Sequence):
     """Simple helper to generate lists of structure compositions.
@@ -170,13 +183,12 @@ class Formulas(Sequence):
 
     atoms: tuple[dict[str, int], ...]
 
-    @property
+    @cached_property
     def elements(self) -> set[str]:
-        """Set of elements present in all formula units."""
-        e: set[str] = set()
-        for s in self.atoms:
-            e = e.union(s.keys())
-        return e
+        """Set of elements present in all formula units.
+
+        Computed once per instance; safe because the dataclass is frozen."""
+        return set().union(*(s.keys() for s in self.atoms))
 
     @classmethod
     def range(cls, elements: str | Iterable[str], *range_args) -> Self:
@@ -189,13 +201,20 @@ class Formulas(Sequence):
             *range_args: passed to the builtin :func:`range`; e.g. ``(1, 3)`` gives counts 1, 2
         """
         if isinstance(elements, str):
-            return cls(tuple({elements: i} for i in range(*range_args)))
+            return cls._cached_range(elements, range_args)
         formulas = [cls.range(e, *range_args) for e in elements]
         total = formulas[0]
         for f in formulas[1:]:
             total *= f
         return total
 
+    @classmethod
+    @lru_cache(maxsize=64)
+    def _cached_range(cls, element: str, range_args: tuple[int, ...]) -> Self:
+        # pure in its arguments and Formulas is a frozen value type, so
+        # repeated calls can share one instance
+        return cls(tuple({element: i} for i in range(*range_args)))
+
     def __add__(self, other: Self) -> Self:
         """Extend underlying list of stoichiometries."""
         return type(self)(self.atoms + other.atoms)
@@ -239,12 +258,13 @@ class Formulas(Sequence):
             min_atoms (:class:`int`): minimum total number of atoms per formula (default: 1)
             max_atoms (:class:`int` or None): maximum total number of atoms per formula; if None, no upper limit is applied
         """
+        sizes = np.fromiter(
+            (sum(f.values()) for f in self.atoms), dtype=np.int64, count=len(self.atoms)
+        )
+        mask = sizes >= min_atoms
         if max_atoms is not None:
-            return type(self)(
-                tuple(f for f in self if min_atoms <= sum(f.values()) <= max_atoms)
-            )
-        else:
-            return type(self)(tuple(f for f in self if min_atoms <= sum(f.values())))
+            mask &= sizes <= max_atoms
+        return type(self)(tuple(f for f, m in zip(self.atoms, mask) if m))
 
 
 def sample(
@@ -255,7 +275,10 @@ def sample(
     max_structures: int | None = None,
     dim: Literal[0, 1, 2, 3] = 3,
     tolerance: (
-        Literal["metallic", "atomic", "molecular", "vdW"] | DistanceFilter | dict
+        Literal["metallic", "atomic", "molecular", "vdW"]
+        | DistanceFilter
+        | dict
+        | Tol_matrix
     ) = "metallic",
     rng: Union[int, np.random.Generator, None] = None,
 ) -> Iterator[Atoms]:
@@ -274,7 +297,9 @@ def sample(
             specifies minimum allowed distances between atoms in generated structures;
             if str then it should be one values understood by :class:`pyxtal.tolerance.Tol_matrix`;
             if dict each value gives the minimum *radius* allowed for an atom, whether a given distance is allowed then
-            depends on the sum of the radii of the respective elements
+            depends on the sum of the radii of the respective elements;
+            a :class:`pyxtal.tolerance.Tol_matrix` is passed on to pyxtal as is, so callers in outer loops can build it
+            once up front
         rng (:class:`int`, :class:`numpy.random.Generator`): seed or random number generator
 
     Yields:
@@ -301,15 +326,17 @@ def sample(
     tm: Tol_matrix | None
     match tolerance:
         case "metallic" | "atomic" | "molecular" | "vdW":
-            tm = Tol_matrix(prototype=tolerance)
+            tm = _prototype_tol_matrix(tolerance)
         case dict():
             tm = (
-                DistanceFilter(tolerance).to_tol_matrix()
+                _radii_tol_matrix(frozenset(tolerance.items()))
                 if len(tolerance) > 0
                 else None
             )
         case DistanceFilter():
             tm = tolerance.to_tol_matrix()
+        case Tol_matrix():
+            tm = tolerance
         case _:
             raise ValueError("invalid value tolerance={tolerance}!")
 
@@ -325,18 +352,18 @@ def sample(
         stoich_str = "".join(f"{s}{n}" for s, n in zip(elements, num_atoms))
         bar.set_description(stoich_str)
 
-        def pop(s):
-            atoms = s.pop("atoms")
-            atoms.info.update(s)
-            return atoms
-
         with catch_warnings(category=UserWarning, action="ignore"):
             px = pyxtal(spacegroups, elements, num_atoms, dim=dim, tm=tm, rng=rng)
-            yield from islice(map(pop, px), max_structures)
-            if max_structures is not None:
-                max_structures -= len(px)
-                if max_structures <= 0:
-                    break
+        generated = 0
+        for s in islice(px, max_structures):
+            atoms = s.pop("atoms")
+            atoms.info.update(s)
+            yield atoms
+            generated += 1
+        if max_structures is not None:
+            max_structures -= generated
+            if max_structures <= 0:
+                break
 
 
 __all__ = [
@@ -7,7 +7,7 @@ convenience."""
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from dataclasses import dataclass, KW_ONLY
-from itertools import combinations_with_replacement, product
+from itertools import product
 from math import nan, inf
 from numbers import Number
 from typing import Callable, Literal
@@ -93,12 +93,17 @@ class DistanceFilter(FilterBase):
             `False`: at least one bond is shorter than the sum of given cutoff radii of the respective elements
             `True`: all bonds are longer than the sum of given cutoff radii of the respective elements
         """
-        pair = self._element_wise_dist(structure)
-        for ei, ej in combinations_with_replacement(structure.symbols.species(), 2):
-            ei, ej = sorted((ei, ej))
-            if pair[ei, ej] < self.radii.get(ei, nan) + self.radii.get(ej, nan):
-                return False
-        return True
+        i, j, d = neighbor_list("ijd", structure, 5.0)
+        if len(d) == 0:
+            return True
+        # one cutoff per atom; comparisons against NaN are False, so missing
+        # radii allow all bonds, as documented above
+        radius = {e: self.radii.get(e, nan) for e in structure.symbols.species()}
+        symbols = structure.get_chemical_symbols()
+        per_atom = np.fromiter(
+            (radius[s] for s in symbols), dtype=np.float64, count=len(symbols)
+        )
+        return not np.any(d < per_atom[i] + per_atom[j])
 
     def to_tol_matrix(
         self, prototype: Literal["metallic", "atomic", "molecular", "vdW"] = "metallic"
@@ -3,15 +3,77 @@
 from pyiron_snippets.import_alarm import ImportAlarm
 
 with ImportAlarm(
-    "matscipy not installed falling back to ASE implementation; "
+    "Neither matscipy nor vesin installed, falling back to ASE implementation; "
     "install with 'conda install -c conda-forge matscipy' or "
-    "'pip install matscipy'",
+    "'pip install matscipy' or 'pip install vesin'",
 ) as neighbor_alarm:
     try:
         from matscipy.neighbours import neighbour_list as neighbor_list
     except ImportError:
-        from ase.neighborlist import neighbor_list
+        try:
+            from vesin import ase_neighbor_list as neighbor_list
+        except ImportError:
+            from ase.neighborlist import neighbor_list
 
-        raise
+            raise
 
-__all__ = ["neighbor_list"]
+import numpy as np
+from ase import Atoms
+
+_BRUTE_FORCE_LIMIT = 256
+"""Structures smaller than this take the brute-force path in :func:`.distances`."""
+
+
+def _brute_force_distances(structure: Atoms, cutoff: float) -> np.ndarray:
+    """All pair distances below `cutoff`, computed by direct enumeration.
+
+    Enumerates the periodic images reachable within `cutoff` explicitly, so
+    it remains correct when the cutoff exceeds half the cell dimensions.
+    Double counts pairs (i->j and j->i) like `neighbor_list("d", ...)`.
+
+    Args:
+        structure (:class:`ase.Atoms`): structure to analyze
+        cutoff (:class:`float`): maximum distance to consider
+
+    Returns:
+        :class:`numpy.ndarray`: flat array of distances
+    """
+    positions = structure.positions
+    cell = structure.cell.array
+    pbc = structure.pbc
+    # number of periodic images needed per lattice vector, from the
+    # perpendicular heights of the cell
+    reps = np.zeros(3, dtype=np.int64)
+    if pbc.any():
+        # wrap the periodic components first; the image counts below only
+        # suffice when all positions lie inside the cell
+        frac = structure.get_scaled_positions(wrap=False)
+        frac[:, pbc] -= np.floor(frac[:, pbc])
+        positions = frac @ structure.cell.complete().array
+        heights = structure.cell.volume / np.linalg.norm(
+            np.cross(np.roll(cell, 1, axis=0), np.roll(cell, 2, axis=0)), axis=1
+        )
+        reps[pbc] = np.ceil(cutoff / heights[pbc]).astype(np.int64)
+    shifts = np.stack(
+        np.meshgrid(*(np.arange(-r, r + 1) for r in reps), indexing="ij"), axis=-1
+    ).reshape(-1, 3) @ cell
+    diff = (
+        positions[None, :, None, :]
+        + shifts[None, None, :, :]
+        - positions[:, None, None, :]
+    )
+    d = np.linalg.norm(diff, axis=-1).ravel()
+    return d[(0.0 < d) & (d < cutoff)]
+
+
+def distances(structure: Atoms, cutoff: float) -> np.ndarray:
+    """All pair distances below `cutoff`, like ``neighbor_list("d", ...)``.
+
+    Small structures are routed to a vectorized brute-force computation that
+    skips the cell-list setup overhead."""
+    if len(structure) < _BRUTE_FORCE_LIMIT:
+        return _brute_force_distances(structure, float(cutoff))
+    return neighbor_list("d", structure, float(cutoff))
+
+
+__all__ = ["neighbor_list", "distances"]
@@ -3,6 +3,7 @@
 import warnings
 from abc import ABC, abstractmethod
 from ase import Atoms
+from ase.data import atomic_numbers, chemical_symbols
 from typing import Iterable, Callable, Self, Iterator, Union
 from dataclasses import dataclass
 import numpy as np
@@ -26,11 +27,16 @@ def rattle(
     if len(structure) == 1:
         raise ValueError("Can only rattle structures larger than one atom.")
 
-    if isinstance(rng, int):
+    if isinstance(sigma, np.ndarray):
+        # per-atom sigma: draw the noise ourselves so scaling and addition
+        # fuse into a single broadcasted expression
+        _rng = np.random.default_rng(rng)
+        structure.positions += _rng.standard_normal(structure.positions.shape) * sigma
+    elif isinstance(rng, int):
         structure.rattle(stdev=sigma, seed=rng)
     else:
         if rng is None:
-            rng = np.random
+            rng = np.random.default_rng()
         structure.rattle(stdev=sigma, rng=rng)
     return structure
 
@@ -59,14 +65,20 @@ def element_scaled_rattle(
         ValueError: if reference values are not positive
         ValueError: if reference does not contain all elements in given structure
     """
-    sigma = sigma * np.ones(len(structure))
     if not all(r > 0 for r in reference.values()):
         raise ValueError("Reference lengths must be strictly positive!")
-    for i, sym in enumerate(structure.symbols):
-        try:
-            sigma[i] *= reference[sym]
-        except KeyError:
-            raise ValueError(f"No value for element {sym} provided in argument `reference`!") from None
+    # lookup table keyed by atomic number, so the per-atom scaling is a single fancy index
+    table = np.full(len(chemical_symbols), np.nan)
+    for sym, r in reference.items():
+        z = atomic_numbers.get(sym)
+        if z is not None:
+            table[z] = r
+    scales = table[structure.numbers]
+    missing = np.isnan(scales)
+    if missing.any():
+        sym = structure.symbols[int(np.flatnonzero(missing)[0])]
+        raise ValueError(f"No value for element {sym} provided in argument `reference`!")
+    sigma = sigma * scales
     return rattle(structure, sigma.reshape(-1, 1), rng=rng)
 
 
@@ -97,29 +109,32 @@ def stretch(
     """
     _rng = np.random.default_rng(rng)
 
-    def get_strains(max_strain, size):
-        if max_strain <= 0.0:
-            return np.zeros(size)
+    for max_strain in (shear, hydro):
         if 0 < max_strain < minimum_strain:
             warnings.warn(
                 f"max_strain ({max_strain}) is smaller than minimum_strain ({minimum_strain}); "
                 "minimum_strain floor cannot be enforced and will be ignored.",
                 UserWarning,
-                stacklevel=3,
+                stacklevel=2,
             )
-        signs = _rng.choice([-1, 1], size=size)
-        # clamp lower bound so the range is valid when minimum_strain > max_strain
-        magnitudes = _rng.uniform(min(minimum_strain, max_strain), max_strain, size=size)
-        return signs * magnitudes
+
+    # draw all six strain components (three shear, three hydrostatic) at once
+    max_strains = np.array([shear] * 3 + [hydro] * 3)
+    # clamp lower bound so the range is valid when minimum_strain > max_strain
+    low = np.minimum(minimum_strain, max_strains)
+    # single draw in [-1, 1); magnitude and sign come from the same sample
+    raw = _rng.uniform(-1.0, 1.0, size=6)
+    magnitudes = low + np.abs(raw) * (max_strains - low)
+    strains = np.where(max_strains > 0.0, np.copysign(magnitudes, raw), 0.0)
 
     strain = np.zeros((3, 3))
     # Off-diagonal elements
     indices = np.triu_indices(3, k=1)
-    strain[indices] = get_strains(shear, 3)
+    strain[indices] = strains[:3]
     strain += strain.T
 
     # Diagonal elements
-    np.fill_diagonal(strain, 1 + get_strains(hydro, 3))
+    np.fill_diagonal(strain, 1 + strains[3:])
 
     structure.set_cell(structure.cell.array @ strain, scale_atoms=True)
     return structure
@@ -130,12 +145,43 @@ class PerturbationABC(ABC):
 
     def __call__(self, structure: Atoms) -> Atoms:
         update_uuid(structure)
+        self._tag(structure)
+        return self._apply(structure)
+
+    def _tag(self, structure: Atoms, description: str | None = None) -> None:
+        """Record this perturbation in the structure's info."""
+        if description is None:
+            description = str(self)
         if "perturbation" not in structure.info:
-            structure.info["perturbation"] = str(self)
+            structure.info["perturbation"] = description
         else:
-            structure.info["perturbation"] += "+" + str(self)
+            structure.info["perturbation"] += "+" + description
+
+    def _apply(self, structure: Atoms) -> Atoms | None:
+        """Apply the bare transformation, without touching any metadata."""
         return structure
 
+    def _apply_described(self, structure: Atoms) -> tuple[Atoms | None, str]:
+        """Apply the bare transformation and report what actually ran.
+
+        Like :meth:`._apply`, but choice perturbations resolve the
+        description to the branch taken."""
+        return self._apply(structure), str(self)
+
+    def _perturb(self, structure: Atoms) -> tuple[Atoms | None, str]:
+        """Update the lineage and apply the transformation, without recording the description.
+
+        Used by :class:`.Series` to tag the full chain in one go."""
+        update_uuid(structure)
+        return self._apply_described(structure)
+
+    def batch(self, structures: Iterable[Atoms]) -> Iterator[Atoms | None]:
+        """Apply the perturbation to each structure in turn.
+
+        Subclasses may override this to amortize work over the whole batch."""
+        for structure in structures:
+            yield self(structure)
+
     @abstractmethod
     def __str__(self) -> str:
         pass
@@ -191,11 +237,29 @@ def perturb(
 
 
 class RngMixin:
-    """Mixin to handle RNG initialization."""
+    """Mixin to handle RNG initialization and pickling.
+
+    Pickles only the state of the underlying bit generator instead of the full
+    :class:`numpy.random.Generator` object."""
 
     def __post_init__(self):
         object.__setattr__(self, "rng", np.random.default_rng(self.rng))
 
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state["rng"] = self.rng.bit_generator.state
+        return state
+
+    def __setstate__(self, state):
+        # seed explicitly so constructing the bit generator does not pull OS
+        # entropy that the restored state immediately overwrites
+        bit_generator = getattr(np.random, state["rng"]["bit_generator"])(0)
+        bit_generator.state = state["rng"]
+        for key, value in state.items():
+            object.__setattr__(
+                self, key, np.random.Generator(bit_generator) if key == "rng" else value
+            )
+
 
 @dataclass(frozen=True)
 class Rattle(RngMixin, PerturbationABC):
@@ -206,10 +270,9 @@ class Rattle(RngMixin, PerturbationABC):
     "Create minimal 2x2x2 super cells when applied to structures of only one atom."
     rng: Union[int, np.random.Generator, None] = None
 
-    def __call__(self, structure: Atoms):
+    def _apply(self, structure: Atoms) -> Atoms:
         if self.create_supercells and len(structure) == 1:
             structure = structure.repeat(2)
-        structure = super().__call__(structure)
         return rattle(structure, self.sigma, rng=self.rng)
 
     def __str__(self):
@@ -230,10 +293,9 @@ class ElementScaledRattle(RngMixin, PerturbationABC):
     "Create minimal 2x2x2 super cells when applied to structures of only one atom."
     rng: Union[int, np.random.Generator, None] = None
 
-    def __call__(self, structure: Atoms):
+    def _apply(self, structure: Atoms) -> Atoms:
         if self.create_supercells and len(structure) == 1:
             structure = structure.repeat(2)
-        structure = super().__call__(structure)
         return element_scaled_rattle(structure, self.sigma, self.reference, rng=self.rng)
 
     def __str__(self):
@@ -249,8 +311,7 @@ class Stretch(RngMixin, PerturbationABC):
     minimum_strain: float = 1e-3
     rng: Union[int, np.random.Generator, None] = None
 
-    def __call__(self, structure: Atoms):
-        structure = super().__call__(structure)
+    def _apply(self, structure: Atoms) -> Atoms:
         return stretch(structure, self.hydro, self.shear, self.minimum_strain, rng=self.rng)
 
     def __str__(self):
@@ -263,9 +324,7 @@ class FunctionPerturbation(PerturbationABC):
 
     func: Perturbation
 
-    def __call__(self, structure: Atoms) -> Atoms:
-        # call super to update uuid
-        structure = super().__call__(structure)
+    def _apply(self, structure: Atoms) -> Atoms | None:
         return self.func(structure)
 
     def __str__(self):
@@ -286,11 +345,28 @@ class Series(PerturbationABC):
         )
 
     def __call__(self, structure: Atoms) -> Atoms | None:
+        # tag the full chain in one go instead of appending to the
+        # description string once per sub-perturbation
+        structure, description = self._apply_described(structure)
+        if structure is not None:
+            self._tag(structure, description)
+        return structure
+
+    def _apply(self, structure: Atoms) -> Atoms | None:
+        return self._apply_described(structure)[0]
+
+    def _apply_described(self, structure: Atoms) -> tuple[Atoms | None, str]:
+        applied = []
         for mod in self.perturbations:
-            structure = mod(structure)
+            structure, description = mod._perturb(structure)
+            applied.append(description)
             if structure is None:
-                return None
-        return structure
+                break
+        return structure, "+".join(applied)
+
+    def _perturb(self, structure: Atoms) -> tuple[Atoms | None, str]:
+        # sub-perturbations update the lineage themselves
+        return self._apply_described(structure)
 
     def __str__(self):
         return "+".join(str(mod) for mod in self.perturbations)
@@ -312,10 +388,26 @@ class RandomChoice(RngMixin, PerturbationABC):
         object.__setattr__(self, "choice_b", _ensure_perturbation(self.choice_b))
 
     def __call__(self, structure: Atoms) -> Atoms:
+        return self._choose()(structure)
+
+    def _choose(self) -> PerturbationABC:
         if self.rng.random() > self.chance:
-            return self.choice_a(structure)
+            return self.choice_a
         else:
-            return self.choice_b(structure)
+            return self.choice_b
+
+    def _apply(self, structure: Atoms) -> Atoms | None:
+        return self._apply_described(structure)[0]
+
+    def _apply_described(self, structure: Atoms) -> tuple[Atoms | None, str]:
+        return self._choose()._apply_described(structure)
+
+    def batch(self, structures: Iterable[Atoms]) -> Iterator[Atoms | None]:
+        """Apply to each structure, drawing all choices in a single RNG call."""
+        structures = list(structures)
+        picks = self.rng.random(len(structures)) > self.chance
+        for structure, pick in zip(structures, picks):
+            yield (self.choice_a if pick else self.choice_b)(structure)
 
     def __str__(self):
         return str(self.choice_a) + "|" + str(self.choice_b)
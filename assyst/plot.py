@@ -1,19 +1,47 @@
 """Helper plotting functions."""
 
+import weakref
 from typing import Literal, Callable, Iterable
-from collections import Counter, defaultdict
 
 from ase import Atoms
-import matplotlib.pyplot as plt
+from ase.data import chemical_symbols
 import numpy as np
-import pandas as pd
-import seaborn as sns
 
-from assyst.neighbors import neighbor_list
+from pyiron_snippets.import_alarm import ImportAlarm
 
+from assyst.neighbors import distances
+from assyst.utils import _parallel_map
 
-def _volume(structures: Iterable[Atoms]) -> list[float]:
-    return [s.cell.volume / len(s) for s in structures]
+with ImportAlarm(
+    "fast_histogram not installed, falling back to matplotlib binning; "
+    "install with 'pip install fast-histogram'",
+) as fast_histogram_alarm:
+    try:
+        from fast_histogram import histogram1d
+    except ImportError:
+        histogram1d = None
+
+        raise
+
+
+def _plt():
+    """Import matplotlib.pyplot on first use.
+
+    Pulling in the plotting stack costs ~100ms of cold start, which callers
+    that only use the data extraction helpers should not pay."""
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
+def _volume(structures: Iterable[Atoms]) -> np.ndarray:
+    structures = list(structures)
+    if not structures:
+        return np.zeros(0)
+    # one batched determinant instead of N python-level .volume calls
+    cells = np.stack([s.cell.array for s in structures])
+    sizes = np.fromiter(map(len, structures), dtype=np.int64, count=len(structures))
+    return np.abs(np.linalg.det(cells)) / sizes
 
 
 def _energy(structures: Iterable[Atoms]) -> list[float]:
@@ -22,23 +50,59 @@ def _energy(structures: Iterable[Atoms]) -> list[float]:
 
 def _concentration(
     structures: Iterable[Atoms], elements: Iterable[str] | None = None
-) -> list[dict[str, float]]:
-    structure_concentrations = [
-        {k: v / len(s) for k, v in Counter(s.symbols).items()} for s in structures
-    ]
-    concentrations = defaultdict(lambda: np.zeros(len(structure_concentrations)))
-    for i, d in enumerate(structure_concentrations):
-        for e, c in d.items():
-            concentrations[e][i] = c
-    if elements is not None:
-        concentrations = {e: concentrations[e] for e in elements}
-    return concentrations
+) -> dict[str, np.ndarray]:
+    structures = list(structures)
+    # species() yields per-structure unique symbols, so the union touches a
+    # handful of strings per structure instead of every atom
+    present = sorted(set().union(*(s.symbols.species() for s in structures)))
+    el2col = {e: i for i, e in enumerate(present)}
+    # dense (structures x elements) concentration matrix; bincount over the
+    # atomic numbers counts each structure at C speed without hashing symbols
+    mat = np.zeros((len(structures), len(present)))
+    for i, s in enumerate(structures):
+        counts = np.bincount(s.numbers)
+        for z in np.nonzero(counts)[0]:
+            mat[i, el2col[chemical_symbols[z]]] = counts[z] / len(s)
+    if elements is None:
+        elements = present
+    zeros = np.zeros(len(structures))
+    return {e: mat[:, el2col[e]] if e in el2col else zeros for e in elements}
+
+
+_distance_cache: dict[int, tuple[weakref.ref, tuple, dict[float, np.ndarray]]] = {}
+
+
+def _neighbor_distances(structure: Atoms, rmax: float) -> np.ndarray:
+    """Neighbor distances within `rmax`, memoized per structure.
+
+    Keyed on the structure object itself plus a cheap geometry fingerprint,
+    so plotting several views of the same training set runs the neighbor
+    search only once while in-place perturbations invalidate the entry.
+    Entries hold a weak reference that evicts them when their structure is
+    collected, which both bounds the cache and keeps :func:`id` keys from
+    being recycled."""
+    key = id(structure)
+    fingerprint = (
+        structure.info.get("uuid"),
+        hash(structure.positions.tobytes()),
+        hash(structure.cell.array.tobytes()),
+    )
+    entry = _distance_cache.get(key)
+    if entry is None or entry[0]() is not structure or entry[1] != fingerprint:
+        ref = weakref.ref(structure, lambda _, key=key: _distance_cache.pop(key, None))
+        entry = _distance_cache[key] = (ref, fingerprint, {})
+    per_rmax = entry[2]
+    rmax = float(rmax)
+    if rmax not in per_rmax:
+        per_rmax[rmax] = distances(structure, rmax)
+    return per_rmax[rmax]
 
 
 def _distance(
     structures: Iterable[Atoms], rmax: float
 ) -> list[Iterable[float]]:
-    return [neighbor_list("d", s, float(rmax)) for s in structures]
+    # neighbor searches release the GIL, so thread across structures
+    return _parallel_map(lambda s: _neighbor_distances(s, rmax), structures)
 
 
 _DISTANCE_LABELS = {
@@ -75,16 +139,9 @@ def _reduce_distances(
     """
     _preset = {"min": np.min, "mean": np.mean}
     if reduce is None:
-        return np.concatenate(
-            [neighbor_list("d", s, float(rmax)) for s in structures]
-        )
+        return np.concatenate(_distance(structures, rmax))
     reduce_func = _preset.get(reduce, reduce)
-    distances = []
-    for s in structures:
-        d = neighbor_list("d", s, float(rmax))
-        if len(d) > 0:
-            distances.append(reduce_func(d))
-    return distances
+    return [reduce_func(d) for d in _distance(structures, rmax) if len(d) > 0]
 
 
 def _plot_histogram(
@@ -122,8 +179,12 @@ def _plot_histogram(
         Return value of :func:`matplotlib.pyplot.hist`, or ``None`` when a dict
         is returned by the extractor.
     """
+    plt = _plt()
     data = extractor(structures)
     if isinstance(data, dict):
+        import pandas as pd
+        import seaborn as sns
+
         df = pd.DataFrame({k: pd.Series(v) for k, v in data.items()})
         df_long = df.melt(var_name='variable', value_name='value')
         ax = plt.gca()
@@ -134,12 +195,41 @@ def _plot_histogram(
         sns.histplot(data=df_long, x='value', hue='variable', ax=ax, bins=bin_edges, **kwargs)
         res = None
     else:
-        res = plt.hist(data, **kwargs)
+        res = _hist(data, **kwargs)
     plt.xlabel(xlabel)
     plt.ylabel(ylabel)
     return res
 
 
+def _hist(data, **kwargs):
+    """Call :func:`matplotlib.pyplot.hist`, pre-binning with fast_histogram when possible.
+
+    For uniform integer `bins` the counts are computed with
+    :func:`fast_histogram.histogram1d` and handed to ``plt.hist`` as
+    pre-weighted bin centers, preserving its return value and styling."""
+    plt = _plt()
+    bins = kwargs.get("bins")
+    data = np.asarray(data, dtype=np.float64)
+    if histogram1d is None or not isinstance(bins, int) or len(data) == 0:
+        return plt.hist(data, **kwargs)
+    # plt.hist ignores range once explicit edges are passed, so consume it here
+    if (range_ := kwargs.pop("range", None)) is not None:
+        lo, hi = map(float, range_)
+    else:
+        lo, hi = data.min(), data.max()
+    if lo == hi:
+        # mirror np.histogram's handling of degenerate ranges
+        lo, hi = lo - 0.5, hi + 0.5
+    counts = histogram1d(data, bins=bins, range=(lo, hi))
+    # histogram1d's top bin is half-open, unlike np.histogram's, so samples
+    # sitting exactly on the upper edge would otherwise be dropped
+    counts[-1] += np.count_nonzero(data == hi)
+    edges = np.linspace(lo, hi, bins + 1)
+    centers = 0.5 * (edges[:-1] + edges[1:])
+    kwargs["bins"] = edges
+    return plt.hist(centers, weights=counts, **kwargs)
+
+
 def volume_histogram(structures: list[Atoms], **kwargs):
     """Plot histogram of per-atom volumes.
 
@@ -168,17 +258,21 @@ def size_histogram(structures: list[Atoms], **kwargs):
         structures (list of :class:`ase.Atoms`):
             structures to plot
         **kwargs:
-            passed through to :func:`matplotlib.pyplot.hist`
+            passed through to :func:`matplotlib.pyplot.bar`
 
     Returns:
-        Return value of :func:`matplotlib.pyplot.hist`"""
-    return _plot_histogram(
-        structures,
-        lambda s: list(map(len, s)),
-        "# Atoms",
-        r"#$\,$Structures",
-        **kwargs
-    )
+        Return value of :func:`matplotlib.pyplot.bar`"""
+    plt = _plt()
+    structures = list(structures)
+    # atom counts are small positive integers, so bincount beats the general
+    # histogram machinery
+    sizes = np.fromiter(map(len, structures), dtype=np.int64, count=len(structures))
+    counts = np.bincount(sizes)
+    idx = np.nonzero(counts)[0]
+    res = plt.bar(idx, counts[idx], width=1.0, align="center", **kwargs)
+    plt.xlabel("# Atoms")
+    plt.ylabel(r"#$\,$Structures")
+    return res
 
 
 def concentration_histogram(
@@ -255,14 +349,22 @@ def radial_distribution(
             structures to plot
         rmax (float):
             maximum cutoff to consider neighborhood
-        **kwargs: pass through to :func:`matplotlib.pyplot.hist`
+        **kwargs: pass through to :func:`matplotlib.pyplot.bar`
 
     Returns:
-        Return value of :func:`matplotlib.pyplot.hist`"""
-    kwargs.setdefault("bins", 100)
-    distances = np.concatenate([n for n in _distance(structures, rmax)])
-    weights = 1 / (4 * np.pi * distances ** 2)
-    res = plt.hist(distances, weights=weights, **kwargs)
+        Return value of :func:`matplotlib.pyplot.bar`"""
+    plt = _plt()
+    bins = kwargs.pop("bins", 100)
+    # accumulate per-structure histograms over a fixed (0, rmax) grid instead
+    # of concatenating every neighbor distance into one huge array; weights of
+    # 1/(4 pi r^2) are applied per bin at its center
+    edges = np.histogram_bin_edges([], bins=bins, range=(0.0, float(rmax)))
+    counts = np.zeros(len(edges) - 1)
+    for s in structures:
+        counts += np.histogram(_neighbor_distances(s, rmax), bins=edges)[0]
+    centers = 0.5 * (edges[:-1] + edges[1:])
+    heights = counts / (4 * np.pi * centers ** 2)
+    res = plt.bar(edges[:-1], heights, width=np.diff(edges), align="edge", **kwargs)
     plt.xlabel(r"Distance [$\mathrm{\AA}$]")
     plt.ylabel("Radial distribution")
     return res
@@ -316,13 +418,14 @@ def energy_distance(
         **kwargs:
             passed through to :func:`matplotlib.pyplot.scatter` or
             :func:`matplotlib.pyplot.hexbin`"""
+    plt = _plt()
     xlabel = _distance_xlabel(reduce)
     structures = list(structures)
     D = _reduce_distances(structures, rmax, reduce)
     # Keep only structures that contributed to D (those with at least one neighbor)
     with_neighbors = [
         s for s in structures
-        if len(neighbor_list("d", s, float(rmax))) > 0
+        if len(_neighbor_distances(s, rmax)) > 0
     ]
     E = _energy(with_neighbors)
     if len(structures) < 1000:
@@ -345,16 +448,30 @@ def energy_volume(structures: list[Atoms], **kwargs):
         structures (list of :class:`ase.Atoms`):
             structures to plot
         **kwargs:
-            passed through to :func:`matplotlib.pyplot.scatter` or :func:`matplotlib.pyplot.hexbin`"""
-    V = _volume(structures)
-    E = _energy(structures)
-    structures = list(structures)
+            passed through to :func:`matplotlib.pyplot.scatter` or :func:`matplotlib.pyplot.pcolormesh`"""
+    plt = _plt()
+    # materialize generators once up front; extracting volumes and energies
+    # afterwards would silently exhaust them.  Sized inputs are used as is.
+    if not hasattr(structures, "__len__"):
+        structures = list(structures)
+    n = np.fromiter(map(len, structures), dtype=np.int64, count=len(structures))
+    V = np.fromiter(
+        (s.cell.volume for s in structures), dtype=np.float64, count=len(structures)
+    ) / n
+    E = np.fromiter(
+        (s.get_potential_energy() for s in structures),
+        dtype=np.float64,
+        count=len(structures),
+    ) / n
     if len(structures) < 1000:
         if "s" not in kwargs and "markersize" not in kwargs:
             kwargs["markersize"] = 5
         plt.scatter(V, E, **kwargs)
     else:
-        plt.hexbin(V, E, **kwargs, bins="log")
+        # pre-bin with numpy; hexbin's internal hashing gets slow for large
+        # point clouds and produces heavyweight output
+        H, xe, ye = np.histogram2d(V, E, bins=kwargs.pop("bins", 64))
+        plt.pcolormesh(xe, ye, np.log1p(H).T, shading="auto", **kwargs)
     plt.xlabel(r"Volume [$\mathrm{\AA}^3/\mathrm{atom}$]")
     plt.ylabel(r"Energy [eV/atom]")
 
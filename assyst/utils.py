@@ -1,6 +1,43 @@
-import uuid
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, TypeVar
+
 from ase import Atoms
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+_PARALLEL_THRESHOLD = 16
+"""Iterables up to this size are mapped serially to avoid pool overhead."""
+
+
+def _parallel_map(
+    func: Callable[[T], R], items: Iterable[T], max_workers: int | None = None
+) -> list[R]:
+    """Map `func` over `items`, using a thread pool for large workloads.
+
+    Only worthwhile when `func` releases the GIL (e.g. C-backed neighbor
+    searches or NumPy-heavy work); short iterables are processed serially.
+
+    Args:
+        func: function to apply to each item
+        items: items to process
+        max_workers (int): thread count, defaults to the executor's choice
+
+    Returns:
+        list: results in input order
+    """
+    items = list(items)
+    if len(items) <= _PARALLEL_THRESHOLD:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(func, items))
+
+def _new_id() -> str:
+    """Random 128-bit hex id; cheaper than uuid.uuid4 but just as unique."""
+    return os.urandom(16).hex()
+
+
 def update_uuid(structure: Atoms) -> Atoms:
     """Updates the UUID of the structure and maintains a lineage.
 
@@ -19,7 +56,7 @@ def update_uuid(structure: Atoms) -> Atoms:
         lineage.append(structure.info['uuid'])
         structure.info['lineage'] = lineage
 
-    new_uuid = str(uuid.uuid4())
+    new_uuid = _new_id()
     structure.info['uuid'] = new_uuid
 
     if 'seed' not in structure.info:
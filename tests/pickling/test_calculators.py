@@ -10,13 +10,13 @@ except ImportError:
 
 def test_pickling_morse():
     m = Morse(epsilon=1.0, r0=1.0, rho0=1.0)
-    p = pickle.dumps(m)
+    p = pickle.dumps(m, protocol=pickle.HIGHEST_PROTOCOL)
     m2 = pickle.loads(p)
     assert m2 == m
 
 @pytest.mark.skipif(not HAS_TENSORPOTENTIAL, reason="tensorpotential not installed")
 def test_pickling_grace():
     g = Grace(model='GRACE-FS-OAM')
-    p = pickle.dumps(g)
+    p = pickle.dumps(g, protocol=pickle.HIGHEST_PROTOCOL)
     g2 = pickle.loads(p)
     assert g2 == g
@@ -11,7 +11,7 @@ def test_pickling_filters():
     or_f = OrFilter(df, vf)
 
     for f in [df, vf, af, ef, ff, and_f, or_f]:
-        p = pickle.dumps(f)
+        p = pickle.dumps(f, protocol=pickle.HIGHEST_PROTOCOL)
         f2 = pickle.loads(p)
         assert type(f2) is type(f)
         assert f2 == f
@@ -1,12 +1,12 @@
 import pickle
 import numpy as np
-from hypothesis import given, strategies as st
+from hypothesis import given, settings, strategies as st
 from assyst.perturbations import Rattle, ElementScaledRattle, Stretch, Series, RandomChoice
-from ase import Atoms
 
-@given(st.floats(min_value=0.01, max_value=1.0), st.integers(min_value=0, max_value=1000), st.integers(min_value=1, max_value=10))
-def test_pickling_rattle(sigma, seed, n_steps):
-    at = Atoms('Al4', positions=[[0,0,0], [1,1,1], [2,2,2], [3,3,3]], cell=[4,4,4], pbc=True)
+@settings(max_examples=25, deadline=None)
+@given(st.floats(min_value=0.01, max_value=1.0), st.integers(min_value=0, max_value=1000), st.integers(min_value=1, max_value=3))
+def test_pickling_rattle(al4, sigma, seed, n_steps):
+    at = al4
     r = Rattle(sigma=sigma, rng=seed)
 
     # Progress RNG
@@ -14,18 +14,19 @@ def test_pickling_rattle(sigma, seed, n_steps):
         r(at.copy())
 
     # Pickle and unpickle
-    p = pickle.dumps(r)
+    p = pickle.dumps(r, protocol=pickle.HIGHEST_PROTOCOL)
     r2 = pickle.loads(p)
 
     # Should produce same next perturbation
     at1 = r(at.copy())
     at2 = r2(at.copy())
 
-    assert np.allclose(at1.positions, at2.positions)
+    assert np.array_equal(at1.positions, at2.positions)
 
-@given(st.floats(min_value=0.01, max_value=1.0), st.integers(min_value=0, max_value=1000), st.integers(min_value=1, max_value=10))
-def test_pickling_element_scaled_rattle(sigma, seed, n_steps):
-    at = Atoms('Al4', positions=[[0,0,0], [1,1,1], [2,2,2], [3,3,3]], cell=[4,4,4], pbc=True)
+@settings(max_examples=25, deadline=None)
+@given(st.floats(min_value=0.01, max_value=1.0), st.integers(min_value=0, max_value=1000), st.integers(min_value=1, max_value=3))
+def test_pickling_element_scaled_rattle(al4, sigma, seed, n_steps):
+    at = al4
     r = ElementScaledRattle(sigma=sigma, reference={'Al': 1.0}, rng=seed)
 
     # Progress RNG
@@ -33,18 +34,19 @@ def test_pickling_element_scaled_rattle(sigma, seed, n_steps):
         r(at.copy())
 
     # Pickle and unpickle
-    p = pickle.dumps(r)
+    p = pickle.dumps(r, protocol=pickle.HIGHEST_PROTOCOL)
     r2 = pickle.loads(p)
 
     # Should produce same next perturbation
     at1 = r(at.copy())
     at2 = r2(at.copy())
 
-    assert np.allclose(at1.positions, at2.positions)
+    assert np.array_equal(at1.positions, at2.positions)
 
-@given(st.floats(min_value=0.01, max_value=0.5), st.floats(min_value=0.01, max_value=0.5), st.integers(min_value=0, max_value=1000), st.integers(min_value=1, max_value=10))
-def test_pickling_stretch(hydro, shear, seed, n_steps):
-    at = Atoms('Al4', positions=[[0,0,0], [1,1,1], [2,2,2], [3,3,3]], cell=[4,4,4], pbc=True)
+@settings(max_examples=25, deadline=None)
+@given(st.floats(min_value=0.01, max_value=0.5), st.floats(min_value=0.01, max_value=0.5), st.integers(min_value=0, max_value=1000), st.integers(min_value=1, max_value=3))
+def test_pickling_stretch(al4, hydro, shear, seed, n_steps):
+    at = al4
     s = Stretch(hydro=hydro, shear=shear, rng=seed)
 
     # Progress RNG
@@ -52,33 +54,34 @@ def test_pickling_stretch(hydro, shear, seed, n_steps):
         s(at.copy())
 
     # Pickle and unpickle
-    p = pickle.dumps(s)
+    p = pickle.dumps(s, protocol=pickle.HIGHEST_PROTOCOL)
     s2 = pickle.loads(p)
 
     # Should produce same next perturbation
     at1 = s(at.copy())
     at2 = s2(at.copy())
 
-    assert np.allclose(at1.cell, at2.cell)
+    assert np.array_equal(at1.cell, at2.cell)
 
-def test_pickling_series():
-    at = Atoms('Al4', positions=[[0,0,0], [1,1,1], [2,2,2], [3,3,3]], cell=[4,4,4], pbc=True)
+def test_pickling_series(al4):
+    at = al4
     r = Rattle(sigma=0.1, rng=42)
     s = Stretch(hydro=0.1, shear=0.1, rng=43)
     ser = Series((r, s))
 
-    p = pickle.dumps(ser)
+    p = pickle.dumps(ser, protocol=pickle.HIGHEST_PROTOCOL)
     ser2 = pickle.loads(p)
 
     at1 = ser(at.copy())
     at2 = ser2(at.copy())
 
-    assert np.allclose(at1.positions, at2.positions)
-    assert np.allclose(at1.cell, at2.cell)
+    assert np.array_equal(at1.positions, at2.positions)
+    assert np.array_equal(at1.cell, at2.cell)
 
-@given(st.floats(min_value=0.0, max_value=1.0), st.integers(min_value=0, max_value=1000), st.integers(min_value=1, max_value=10))
-def test_pickling_random_choice(chance, seed, n_steps):
-    at = Atoms('Al4', positions=[[0,0,0], [1,1,1], [2,2,2], [3,3,3]], cell=[4,4,4], pbc=True)
+@settings(max_examples=25, deadline=None)
+@given(st.floats(min_value=0.0, max_value=1.0), st.integers(min_value=0, max_value=1000), st.integers(min_value=1, max_value=3))
+def test_pickling_random_choice(al4, chance, seed, n_steps):
+    at = al4
     p1 = Rattle(sigma=0.01, rng=seed)
     p2 = Rattle(sigma=0.5, rng=seed+1)
     rc = RandomChoice(p1, p2, chance=chance, rng=seed+2)
@@ -88,11 +91,11 @@ def test_pickling_random_choice(chance, seed, n_steps):
         rc(at.copy())
 
     # Pickle and unpickle
-    p = pickle.dumps(rc)
+    p = pickle.dumps(rc, protocol=pickle.HIGHEST_PROTOCOL)
     rc2 = pickle.loads(p)
 
     # Should produce same next choices/perturbations
     at1 = rc(at.copy())
     at2 = rc2(at.copy())
 
-    assert np.allclose(at1.positions, at2.positions)
+    assert np.array_equal(at1.positions, at2.positions)
@@ -4,6 +4,6 @@ from assyst.relaxations import Relax, CellRelax, VolumeRelax, SymmetryRelax, Ful
 def test_pickling_relax_classes():
     for cls in [Relax, CellRelax, VolumeRelax, SymmetryRelax, FullRelax]:
         r = cls(max_steps=100, force_tolerance=1e-3)
-        p = pickle.dumps(r)
+        p = pickle.dumps(r, protocol=pickle.HIGHEST_PROTOCOL)
         r2 = pickle.loads(p)
         assert r2 == r
@@ -0,0 +1,8 @@
+import pytest
+from ase import Atoms
+
+
+@pytest.fixture(scope="module")
+def al4():
+    """Shared test structure; tests must copy() before mutating."""
+    return Atoms('Al4', positions=[[0,0,0], [1,1,1], [2,2,2], [3,3,3]], cell=[4,4,4], pbc=True)
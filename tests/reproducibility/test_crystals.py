@@ -31,6 +31,7 @@ def test_sample_reproducibility():
     formulas = Formulas(({'Al': 4},))
     spacegroups = [225]
 
-    at1 = list(sample(formulas, spacegroups, rng=42))[0]
-    at2 = list(sample(formulas, spacegroups, rng=42))[0]
+    # sample is a generator; pull only the structure under test
+    at1 = next(sample(formulas, spacegroups, rng=42))
+    at2 = next(sample(formulas, spacegroups, rng=42))
     assert np.allclose(at1.positions, at2.positions)
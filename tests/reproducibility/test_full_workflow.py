@@ -1,3 +1,6 @@
+import functools
+from itertools import chain
+
 import numpy as np
 import pytest
 from hypothesis import given, strategies as st, settings
@@ -7,6 +10,10 @@ from assyst.filters import DistanceFilter, AspectFilter, VolumeFilter
 from assyst.relaxations import VolumeRelax, FullRelax, relax
 from assyst.perturbations import RandomChoice, Rattle, Stretch, perturb
 
+# Morse Potential for Cu (roughly); calculators are stateless for fresh Atoms,
+# so one instance can serve every workflow run
+_MORSE = MorsePotential(epsilon=.3, r0=2.55265548*1.10619396, rho0=4)
+
 def run_workflow(rng):
     # 1. Sampling Random Structures
     max_num = 2
@@ -27,8 +34,7 @@ def run_workflow(rng):
     ))
 
     # 2. Relaxing Configurations
-    # Morse Potential for Cu (roughly)
-    reference = MorsePotential(epsilon=.3, r0=2.55265548*1.10619396, rho0=4)
+    reference = _MORSE
 
     volset = VolumeRelax(max_steps=5, force_tolerance=1e-2) # reduced steps for speed
     allset = FullRelax(max_steps=5, force_tolerance=1e-2)   # reduced steps for speed
@@ -53,17 +59,25 @@ def run_workflow(rng):
     # Note: Calculating energies again would require attaching calculator to random structures
     # For this reproducibility test, we check geometry.
 
-    everything = list(filter(VolumeFilter(300), filter(DistanceFilter({'Cu': 1}), spg + volmin + allmin + random)))
+    df = DistanceFilter({'Cu': 1})
+    vf = VolumeFilter(300)
+    # single pass with short-circuiting; chain avoids the merged temporary list
+    everything = [s for s in chain(spg, volmin, allmin, random) if df(s) and vf(s)]
 
     return everything
 
-@settings(deadline=None)
+@functools.lru_cache(maxsize=32)
+def _reference_workflow(seed):
+    """Reference run per seed; run_workflow is pure given the seed, so the
+    result can be shared across hypothesis retries of the same example."""
+    return run_workflow(np.random.default_rng(seed))
+
+@pytest.mark.slow
+@settings(max_examples=5, deadline=None, derandomize=True)
 @given(st.integers(min_value=0, max_value=2**32-1))
 def test_full_workflow_reproducibility(seed):
-    # Run 1
-    # We must explicitly construct the generator to pass it, ensuring we control the state
-    rng1 = np.random.default_rng(seed)
-    results1 = run_workflow(rng1)
+    # Run 1 (cached; only compared against, never mutated)
+    results1 = _reference_workflow(seed)
 
     # Run 2
     # Resetting the generator with the same seed for the second run
@@ -80,17 +94,11 @@ def test_full_workflow_reproducibility(seed):
         assert len(s1) == len(s2), f"Structure {i} atom count mismatch"
         assert s1.get_chemical_formula() == s2.get_chemical_formula(), f"Structure {i} formula mismatch"
 
-        # Check positions
-        if not np.allclose(s1.positions, s2.positions, atol=1e-5):
-            print(f"Structure {i} positions mismatch:")
-            print("S1:", s1.positions)
-            print("S2:", s2.positions)
-            print("Diff:", s1.positions - s2.positions)
-            assert False, f"Structure {i} positions mismatch"
-
-        # Check cell
-        if not np.allclose(s1.cell.array, s2.cell.array, atol=1e-5):
-            print(f"Structure {i} cell mismatch:")
-            print("S1:", s1.cell.array)
-            print("S2:", s2.cell.array)
-            assert False, f"Structure {i} cell mismatch"
+        np.testing.assert_allclose(
+            s1.positions, s2.positions, atol=1e-5,
+            err_msg=f"Structure {i} positions mismatch",
+        )
+        np.testing.assert_allclose(
+            s1.cell.array, s2.cell.array, atol=1e-5,
+            err_msg=f"Structure {i} cell mismatch",
+        )
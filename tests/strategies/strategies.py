@@ -1,14 +1,17 @@
 from hypothesis import strategies as st
-from pyxtal.lattice import generate_cellpara
 from ase.cell import Cell
 from ase.data import atomic_numbers
 from ase.build import bulk
 
 @st.composite
 def cells(draw):
-    ltype = st.sampled_from(["monoclinic", "triclinic", "orthorhombic", "tetragonal", "hexagonal", "trigonal", "cubic"])
-    volume = st.floats(min_value=5, max_value=100, allow_nan=False, allow_infinity=False)
-    return Cell.fromcellpar(generate_cellpara(draw(ltype), draw(volume)))
+    # draw cell parameters directly instead of going through pyxtal's
+    # rejection sampling; angles in [70, 110] always give a valid cell
+    lengths = st.floats(min_value=1, max_value=10, allow_nan=False, allow_infinity=False)
+    angles = st.floats(min_value=70, max_value=110, allow_nan=False, allow_infinity=False)
+    volume = draw(st.floats(min_value=5, max_value=100, allow_nan=False, allow_infinity=False))
+    cell = Cell.fromcellpar([draw(lengths) for _ in range(3)] + [draw(angles) for _ in range(3)])
+    return Cell(cell.array * (volume / cell.volume) ** (1 / 3))
 
 def elements():
     # pyxtal tol somehow only supports until element 105
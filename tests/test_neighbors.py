@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+from ase import Atoms
+from ase.build import bulk
+from ase.neighborlist import neighbor_list as ase_neighbor_list
+
+from assyst.neighbors import _brute_force_distances, distances
+
+
+@pytest.mark.parametrize("cutoff", [3.0, 6.0])
+def test_brute_force_matches_ase_cubic(cutoff):
+    """Brute-force distances should agree with ASE's cell-list implementation."""
+    structure = bulk("Cu", cubic=True).repeat(2)
+    expected = np.sort(ase_neighbor_list("d", structure, cutoff))
+    actual = np.sort(_brute_force_distances(structure, cutoff))
+    np.testing.assert_allclose(actual, expected)
+
+
+def test_brute_force_matches_ase_primitive():
+    """Cutoffs larger than the cell require multiple periodic images."""
+    structure = bulk("Cu")  # primitive fcc, non-orthogonal cell
+    expected = np.sort(ase_neighbor_list("d", structure, 6.0))
+    actual = np.sort(_brute_force_distances(structure, 6.0))
+    np.testing.assert_allclose(actual, expected)
+
+
+def test_brute_force_unwrapped_positions():
+    """Atoms displaced by whole lattice vectors must not change the result."""
+    structure = bulk("Cu", cubic=True).repeat(2)
+    structure.positions[0] += 2 * structure.cell[0]
+    expected = np.sort(ase_neighbor_list("d", structure, 6.0))
+    actual = np.sort(_brute_force_distances(structure, 6.0))
+    np.testing.assert_allclose(actual, expected)
+
+
+def test_brute_force_nonperiodic():
+    structure = Atoms("H2", positions=[[0, 0, 0], [1, 0, 0]], cell=[10, 10, 10])
+    expected = np.sort(ase_neighbor_list("d", structure, 6.0))
+    actual = np.sort(_brute_force_distances(structure, 6.0))
+    np.testing.assert_allclose(actual, expected)
+
+
+def test_distances_routes_small_structures():
+    structure = bulk("Cu", cubic=True)
+    expected = np.sort(ase_neighbor_list("d", structure, 5.0))
+    actual = np.sort(distances(structure, 5.0))
+    np.testing.assert_allclose(actual, expected)
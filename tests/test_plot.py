@@ -99,10 +99,10 @@ class TestPlotFunctions(unittest.TestCase):
         volume_histogram(self.structures)
         mock_hist.assert_called_once()
 
-    @patch('matplotlib.pyplot.hist')
-    def test_size_histogram(self, mock_hist):
+    @patch('matplotlib.pyplot.bar')
+    def test_size_histogram(self, mock_bar):
         size_histogram(self.structures)
-        mock_hist.assert_called_once()
+        mock_bar.assert_called_once()
 
     @patch('seaborn.histplot')
     def test_concentration_histogram(self, mock_histplot):
@@ -127,10 +127,10 @@ class TestPlotFunctions(unittest.TestCase):
         distance_histogram([no_neighbors] + self.structures, reduce="mean")
 
     @unittest.skipIf(matscipy is None, "matscipy not installed")
-    @patch('matplotlib.pyplot.hist')
-    def test_radial_distribution(self, mock_hist):
+    @patch('matplotlib.pyplot.bar')
+    def test_radial_distribution(self, mock_bar):
         radial_distribution(self.structures)
-        mock_hist.assert_called_once()
+        mock_bar.assert_called_once()
 
     @patch('matplotlib.pyplot.hist')
     def test_energy_histogram(self, mock_hist):
@@ -188,13 +188,13 @@ class TestPlotFunctions(unittest.TestCase):
         energy_volume([s])
         mock_scatter.assert_called_once()
 
-    @patch('matplotlib.pyplot.hexbin')
-    def test_energy_volume_hexbin(self, mock_hexbin):
+    @patch('matplotlib.pyplot.pcolormesh')
+    def test_energy_volume_large(self, mock_pcolormesh):
         s = Atoms('H', cell=[10,10,10])
         s.calc = MagicMock()
         s.calc.get_potential_energy.return_value = -1.0
         energy_volume([s] * 1001)
-        mock_hexbin.assert_called_once()
+        mock_pcolormesh.assert_called_once()
 
 
 class TestCellShapeHelpers(unittest.TestCase):
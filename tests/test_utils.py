@@ -1,12 +1,17 @@
 import uuid
 import pytest
 from ase import Atoms
-from assyst.utils import update_uuid
+from assyst.utils import update_uuid, _parallel_map
 
-@pytest.fixture
-def atoms():
+@pytest.fixture(scope="module")
+def _atoms_template():
     return Atoms('H2', positions=[[0, 0, 0], [0.74, 0, 0]])
 
+@pytest.fixture
+def atoms(_atoms_template):
+    # copy() skips re-parsing the formula string on every test
+    return _atoms_template.copy()
+
 def test_update_uuid_no_existing_uuid(atoms):
     """Test update_uuid when structure has no UUID."""
     updated_atoms = update_uuid(atoms)
@@ -76,3 +81,9 @@ def test_update_uuid_lineage_independence(atoms):
     # original_lineage should NOT have "uuid3"
     assert "uuid3" not in original_lineage
     assert id(updated_s3.info['lineage']) != id(original_lineage)
+
+@pytest.mark.parametrize('n', [5, 50])
+def test_parallel_map_matches_serial(n):
+    """_parallel_map should preserve order on both serial and threaded paths."""
+    items = list(range(n))
+    assert _parallel_map(lambda x: x * 2, items) == [x * 2 for x in items]
@@ -0,0 +1,49 @@
+import pytest
+from ase import Atoms
+from assyst.calculators import Morse
+from assyst.crystals import pyxtal
+from assyst.perturbations import Rattle, Stretch
+from assyst.relaxations import Relax
+
+def assert_single_step_lineage(out, prior_uuid):
+    """Check that a structure got a fresh uuid and records exactly one ancestor."""
+    assert out.info["uuid"] != prior_uuid
+    assert out.info["lineage"] == [prior_uuid]
+
+@pytest.fixture(scope="module")
+def _cu2_template():
+    return Atoms("Cu2", positions=[[0,0,0], [1,1,1]], cell=[3,3,3], pbc=True)
+
+@pytest.fixture
+def cu2_atoms(_cu2_template):
+    # copy() skips re-parsing the formula string on every test
+    return _cu2_template.copy()
+
+@pytest.fixture
+def cu2_atoms_with_uuid(_cu2_template, request):
+    """Cu2 copy with a preset uuid; parametrize with indirect=True to pick it."""
+    a = _cu2_template.copy()
+    a.info["uuid"] = request.param
+    return a
+
+@pytest.fixture(scope="session")
+def pyxtal_cu2():
+    """Seeded Cu2 crystal template; tests must copy() before mutating."""
+    return pyxtal(1, species=["Cu"], num_ions=[2], rng=42)
+
+@pytest.fixture(scope="session")
+def morse_calc():
+    return Morse()
+
+@pytest.fixture(scope="session")
+def relax_1step():
+    # lineage tests only care about uuid propagation, so one step is enough
+    return Relax(max_steps=1)
+
+@pytest.fixture
+def rattle_pert():
+    return Rattle(0.1)
+
+@pytest.fixture
+def stretch_pert():
+    return Stretch(0.1, 0.1)